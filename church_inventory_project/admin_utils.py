@@ -0,0 +1,4 @@
+def is_changelist(request):
+    """Check whether the request is for an admin changelist page"""
+    match = getattr(request, 'resolver_match', None)
+    return match is not None and (match.url_name or '').endswith('_changelist')
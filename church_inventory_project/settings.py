@@ -1,7 +1,9 @@
 import os
+import warnings
 from datetime import timedelta
 from pathlib import Path
 from dotenv import load_dotenv
+from seal.exceptions import UnsealedAttributeAccess
 
 # Load environment variables
 load_dotenv()
@@ -16,6 +18,10 @@ SECRET_KEY = os.getenv('SECRET_KEY', 'django-insecure-default-key-for-developmen
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = os.getenv('DEBUG', 'True') == 'True'
 
+# Lazy loads on sealed querysets are errors during development and tests
+if DEBUG:
+    warnings.filterwarnings('error', category=UnsealedAttributeAccess)
+
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
 
 # Application definition
@@ -26,11 +32,13 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third-party apps
     'rest_framework',
     'corsheaders',
     'rest_framework_simplejwt',
+    'easy_thumbnails',
     
     # Local apps
     'users',
@@ -78,12 +86,44 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', 'postgres'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        # Reuse connections across requests instead of reconnecting every time
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'OPTIONS': {
+            'sslmode': os.getenv('DB_SSLMODE', 'prefer'),
+        },
     }
 }
 
 # Custom user model
 AUTH_USER_MODEL = 'users.User'
 
+AUTHENTICATION_BACKENDS = [
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+# Cache (Redis when REDIS_URL is set, otherwise per-process memory)
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+    # Every worker sees the same cache, so deleting a key invalidates it everywhere
+    SHARED_CACHE = True
+    # Serving session users from the cache is only safe when every worker shares
+    # it, so invalidation on save reaches them all. ModelBackend stays listed so
+    # sessions created under it remain valid; CachedModelBackend ends the chain on
+    # a failed login, so ModelBackend never checks the same password again.
+    AUTHENTICATION_BACKENDS.insert(0, 'users.backends.CachedModelBackend')
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    SHARED_CACHE = False
+
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -143,5 +183,12 @@ STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Thumbnails (easy-thumbnails)
+THUMBNAIL_ALIASES = {
+    '': {
+        'admin_thumbnail': {'size': (80, 80), 'crop': True},
+    },
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -1,6 +1,14 @@
+from django import forms
 from django.contrib import admin
+from django.db.models import BigIntegerField, BooleanField, Case, ExpressionWrapper, F, When
+from django.utils import timezone
 from django.utils.html import format_html
-from .models import Category, Item, InventoryTransaction, Maintenance, ItemCheckout
+from django.utils.translation import gettext_lazy as _
+from easy_thumbnails.exceptions import InvalidImageFormatError
+from easy_thumbnails.files import get_thumbnailer
+from church_inventory_project.admin_utils import is_changelist
+from .models import Category, Item, InventoryTransaction, Maintenance, ItemCheckout, cents_to_decimal
+
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
@@ -8,6 +16,7 @@ class CategoryAdmin(admin.ModelAdmin):
     Admin interface for Category model.
     """
     list_display = ('name', 'parent', 'description')
+    list_select_related = ('parent',)
     search_fields = ('name', 'description')
     list_filter = ('parent',)
 
@@ -18,6 +27,10 @@ class MaintenanceInline(admin.TabularInline):
     """
     model = Maintenance
     extra = 0
+    
+    def get_queryset(self, request):
+        """Get the queryset for the inline, including related staff objects"""
+        return super().get_queryset(request).select_related('internal_staff')
 
 
 class InventoryTransactionInline(admin.TabularInline):
@@ -31,6 +44,10 @@ class InventoryTransactionInline(admin.TabularInline):
               'from_ministry', 'to_ministry', 'reason', 'transaction_date', 'conducted_by')
     max_num = 10  # Limit the number of transactions shown
     can_delete = False
+    
+    def get_queryset(self, request):
+        """Get the queryset for the inline, including related ministry and user objects"""
+        return super().get_queryset(request).select_related('from_ministry', 'to_ministry', 'conducted_by')
 
 
 class ItemCheckoutInline(admin.TabularInline):
@@ -41,6 +58,32 @@ class ItemCheckoutInline(admin.TabularInline):
     extra = 0
     fields = ('checked_out_by', 'checkout_date', 'due_date', 'quantity', 
               'purpose', 'checked_in_date')
+    
+    def get_queryset(self, request):
+        """Get the queryset for the inline, including related user objects"""
+        return super().get_queryset(request).select_related('checked_out_by')
+
+
+class ItemAdminForm(forms.ModelForm):
+    """
+    Admin form for Item model.
+    
+    Items store their unit value as integer cents; the form edits it as a currency amount.
+    """
+    unit_value = forms.DecimalField(label=_('unit value'), max_digits=10, decimal_places=2,
+                                    min_value=0, initial=0)
+    
+    class Meta:
+        model = Item
+        exclude = ('unit_value_cents',)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.initial.setdefault('unit_value', self.instance.unit_value)
+    
+    def save(self, commit=True):
+        self.instance.unit_value = self.cleaned_data['unit_value']
+        return super().save(commit)
 
 
 @admin.register(Item)
@@ -48,8 +91,12 @@ class ItemAdmin(admin.ModelAdmin):
     """
     Admin interface for Item model.
     """
-    list_display = ('name', 'category', 'ministry_area', 'quantity', 'display_total_value', 
+    form = ItemAdminForm
+    list_display = ('name', 'image_thumbnail', 'category', 'ministry_area', 'quantity', 'display_total_value', 
                    'condition', 'needs_reorder_flag')
+    list_select_related = ('category', 'ministry_area')
+    list_per_page = 50
+    show_full_result_count = False
     list_filter = ('category', 'ministry_area', 'condition', 'acquisition_date')
     search_fields = ('name', 'description', 'barcode', 'location')
     inlines = [MaintenanceInline, InventoryTransactionInline, ItemCheckoutInline]
@@ -70,17 +117,55 @@ class ItemAdmin(admin.ModelAdmin):
     )
     readonly_fields = ('created_at', 'updated_at')
     
+    # Never call list(qs) here; use .values() / .only() (or .values_list('pk', flat=True)
+    # when only IDs are needed) so wide Item rows are not hydrated unnecessarily.
+    def get_queryset(self, request):
+        """
+        Get the queryset for the admin view, including related category and ministry objects.
+        
+        Total value and reorder status are computed in SQL so the changelist can sort by them,
+        and the changelist only loads the columns it displays.
+        """
+        qs = super().get_queryset(request).select_related('category', 'ministry_area')
+        if is_changelist(request):
+            qs = qs.only('id', 'name', 'image', 'quantity', 'unit_value_cents', 'min_quantity', 'condition',
+                         'category', 'category__name', 'ministry_area', 'ministry_area__name')
+        return qs.annotate(
+            _total_value_cents=ExpressionWrapper(
+                F('quantity') * F('unit_value_cents'),
+                output_field=BigIntegerField()
+            ),
+            _needs_reorder=Case(
+                When(quantity__lte=F('min_quantity'), then=True),
+                default=False,
+                output_field=BooleanField()
+            ),
+        )
+    
+    def image_thumbnail(self, obj):
+        """Display a small cached thumbnail instead of the full-size image"""
+        if not obj.image:
+            return ''
+        try:
+            thumbnail = get_thumbnailer(obj.image)['admin_thumbnail']
+        except InvalidImageFormatError:
+            return ''
+        return format_html('<img src="{}" alt="">', thumbnail.url)
+    image_thumbnail.short_description = 'Image'
+    
     def display_total_value(self, obj):
         """Display the total value with currency formatting"""
-        return f"${obj.total_value:.2f}"
+        return f"${cents_to_decimal(obj._total_value_cents):.2f}"
     display_total_value.short_description = 'Total Value'
+    display_total_value.admin_order_field = '_total_value_cents'
     
     def needs_reorder_flag(self, obj):
         """Display a visual indicator if item needs reordering"""
-        if obj.needs_reorder:
+        if obj._needs_reorder:
             return format_html('<span style="color: red; font-weight: bold;">⚠️ Low Stock</span>')
         return format_html('<span style="color: green;">✓ In Stock</span>')
     needs_reorder_flag.short_description = 'Stock Status'
+    needs_reorder_flag.admin_order_field = '_needs_reorder'
     
     def save_model(self, request, obj, form, change):
         """Override save_model to track user who created/updated the item"""
@@ -106,10 +191,20 @@ class InventoryTransactionAdmin(admin.ModelAdmin):
     """
     list_display = ('item', 'transaction_type', 'quantity', 'previous_quantity', 
                    'new_quantity', 'conducted_by', 'transaction_date')
+    list_select_related = ('item', 'conducted_by', 'from_ministry', 'to_ministry')
+    list_per_page = 50
+    show_full_result_count = False
     list_filter = ('transaction_type', 'transaction_date', 'from_ministry', 'to_ministry')
     search_fields = ('item__name', 'reason', 'conducted_by__username')
     date_hierarchy = 'transaction_date'
     readonly_fields = ('previous_quantity', 'new_quantity', 'transaction_date')
+    
+    def get_queryset(self, request):
+        """Get the queryset for the admin view, skipping the reason text on the changelist"""
+        qs = super().get_queryset(request)
+        if is_changelist(request):
+            qs = qs.defer('reason')
+        return qs
 
 
 @admin.register(Maintenance)
@@ -118,9 +213,19 @@ class MaintenanceAdmin(admin.ModelAdmin):
     Admin interface for Maintenance model.
     """
     list_display = ('item', 'maintenance_date', 'performed_by', 'cost', 'next_maintenance_date')
+    list_select_related = ('item', 'internal_staff')
+    list_per_page = 50
+    show_full_result_count = False
     list_filter = ('maintenance_date', 'next_maintenance_date', 'internal_staff')
     search_fields = ('item__name', 'description', 'performed_by')
     date_hierarchy = 'maintenance_date'
+    
+    def get_queryset(self, request):
+        """Get the queryset for the admin view, skipping the description text on the changelist"""
+        qs = super().get_queryset(request)
+        if is_changelist(request):
+            qs = qs.defer('description')
+        return qs
 
 
 @admin.register(ItemCheckout)
@@ -130,15 +235,30 @@ class ItemCheckoutAdmin(admin.ModelAdmin):
     """
     list_display = ('item', 'checked_out_by', 'checkout_date', 'due_date', 
                    'quantity', 'checked_in_date', 'checkout_status')
+    list_select_related = ('item', 'checked_out_by')
+    list_per_page = 50
+    show_full_result_count = False
     list_filter = ('checkout_date', 'due_date', 'checked_in_date')
     search_fields = ('item__name', 'checked_out_by__username', 'purpose')
     date_hierarchy = 'checkout_date'
     
+    def get_queryset(self, request):
+        """Get the queryset for the admin view, computing the overdue flag in SQL"""
+        today = timezone.now().date()
+        return super().get_queryset(request).annotate(
+            _is_overdue=Case(
+                When(checked_in_date__isnull=False, then=False),
+                When(due_date__lt=today, then=True),
+                default=False,
+                output_field=BooleanField()
+            ),
+        )
+    
     def checkout_status(self, obj):
         """Display checkout status with color indicators"""
         if obj.checked_in_date:
             return format_html('<span style="color: green;">Returned</span>')
-        elif obj.is_overdue:
+        elif obj._is_overdue:
             return format_html('<span style="color: red; font-weight: bold;">Overdue</span>')
         else:
             return format_html('<span style="color: orange;">Checked Out</span>')
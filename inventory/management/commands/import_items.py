@@ -0,0 +1,127 @@
+"""
+Management command for bulk-loading inventory items from a CSV file.
+
+Rows are streamed into a temporary staging table with PostgreSQL COPY and then
+merged into the item table with a single INSERT ... SELECT, which also writes
+the initial inventory transaction for every imported item.
+"""
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from inventory.models import InventorySummary, InventoryTransaction, Item
+
+# Columns accepted in the CSV header, with their staging table types
+STAGING_COLUMNS = {
+    'name': 'varchar(200)',
+    'description': 'text',
+    'category_id': 'bigint',
+    'ministry_area_id': 'bigint',
+    'quantity': 'integer',
+    'min_quantity': 'integer',
+    'unit_value': 'numeric(10, 2)',
+    'acquisition_date': 'date',
+    'condition': 'varchar(10)',
+    'location': 'varchar(100)',
+    'barcode': 'varchar(100)',
+    'notes': 'text',
+}
+
+MERGE_SQL = """
+    WITH new_items AS (
+        INSERT INTO {item_table} (
+            name, description, category_id, ministry_area_id, quantity, min_quantity,
+            unit_value_cents, acquisition_date, condition, location, barcode, image, notes,
+            created_at, updated_at
+        )
+        SELECT
+            name, COALESCE(description, ''), category_id, ministry_area_id,
+            COALESCE(quantity, 0), COALESCE(min_quantity, 0), ROUND(COALESCE(unit_value, 0) * 100)::bigint,
+            acquisition_date, COALESCE(condition, '{default_condition}'), COALESCE(location, ''),
+            NULLIF(barcode, ''), '', COALESCE(notes, ''), now(), now()
+        FROM import_item_staging
+        RETURNING id, quantity
+    )
+    INSERT INTO {transaction_table} (
+        item_id, transaction_type, quantity, previous_quantity, new_quantity, reason, transaction_date
+    )
+    SELECT id, '{transaction_type}', quantity, 0, quantity, 'Initial inventory creation', now()
+    FROM new_items
+"""
+
+
+class Command(BaseCommand):
+    help = 'Bulk import inventory items from a CSV file using PostgreSQL COPY'
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path', help='Path to a CSV file with a header row')
+        parser.add_argument(
+            '--drop-indexes',
+            action='store_true',
+            help='Drop non-unique item indexes during the load and rebuild them afterwards '
+                 '(faster for very large files)',
+        )
+
+    def handle(self, *args, **options):
+        csv_path = options['csv_path']
+        header = self.read_header(csv_path)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                'CREATE TEMPORARY TABLE import_item_staging (%s) ON COMMIT DROP'
+                % ', '.join(f'{column} {db_type}' for column, db_type in STAGING_COLUMNS.items())
+            )
+            with open(csv_path, newline='', encoding='utf-8') as csv_file:
+                cursor.copy_expert(
+                    'COPY import_item_staging (%s) FROM STDIN WITH CSV HEADER' % ', '.join(header),
+                    csv_file
+                )
+
+            index_definitions = self.drop_indexes(cursor) if options['drop_indexes'] else []
+
+            cursor.execute(MERGE_SQL.format(
+                item_table=connection.ops.quote_name(Item._meta.db_table),
+                transaction_table=connection.ops.quote_name(InventoryTransaction._meta.db_table),
+                default_condition=Item.Condition.GOOD,
+                transaction_type=InventoryTransaction.TransactionType.ADDITION,
+            ))
+            imported = cursor.rowcount
+
+            for definition in index_definitions:
+                cursor.execute(definition)
+
+            InventorySummary.refresh_on_commit()
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {imported} items from {csv_path}"))
+
+    def read_header(self, csv_path):
+        """Read and validate the CSV header row"""
+        try:
+            with open(csv_path, newline='', encoding='utf-8') as csv_file:
+                header = next(csv.reader(csv_file), None)
+        except OSError as e:
+            raise CommandError(f"Could not read {csv_path}: {e}")
+
+        if not header:
+            raise CommandError(f"{csv_path} has no header row")
+        header = [column.strip() for column in header]
+        unknown = [column for column in header if column not in STAGING_COLUMNS]
+        if unknown:
+            raise CommandError(f"Unknown columns in {csv_path}: {', '.join(unknown)}")
+        if 'name' not in header:
+            raise CommandError(f"{csv_path} must have a 'name' column")
+        return header
+
+    def drop_indexes(self, cursor):
+        """Drop the non-unique indexes on the item table, returning their definitions"""
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = %s "
+            "AND indexdef NOT LIKE 'CREATE UNIQUE INDEX%%'",
+            [Item._meta.db_table]
+        )
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute('DROP INDEX %s' % connection.ops.quote_name(name))
+        return [definition for _, definition in indexes]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0003_category_parent_item_created_by_item_last_updated_by_and_more'),
+        ('ministry_areas', '0003_ministryarea_active_ministryarea_notes_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='item',
+            name='acquisition_date',
+            field=models.DateField(blank=True, db_index=True, null=True, verbose_name='acquisition date'),
+        ),
+        migrations.AlterField(
+            model_name='item',
+            name='condition',
+            field=models.CharField(choices=[('NEW', 'New'), ('EXCELLENT', 'Excellent'), ('GOOD', 'Good'), ('FAIR', 'Fair'), ('POOR', 'Poor'), ('DAMAGED', 'Damaged')], db_index=True, default='GOOD', max_length=10, verbose_name='condition'),
+        ),
+        migrations.AlterField(
+            model_name='item',
+            name='location',
+            field=models.CharField(blank=True, db_index=True, max_length=100, verbose_name='storage location'),
+        ),
+        migrations.AlterField(
+            model_name='item',
+            name='name',
+            field=models.CharField(db_index=True, max_length=200, verbose_name='name'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['category', 'ministry_area'], name='item_category_ministry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['ministry_area', 'condition'], name='item_ministry_condition_idx'),
+        ),
+    ]
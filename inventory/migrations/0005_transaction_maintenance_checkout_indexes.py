@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-15 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0004_item_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='inventorytransaction',
+            index=models.Index(fields=['item', '-transaction_date'], name='txn_item_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventorytransaction',
+            index=models.Index(fields=['-transaction_date'], name='txn_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventorytransaction',
+            index=models.Index(fields=['transaction_type'], name='txn_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenance',
+            index=models.Index(fields=['item', '-maintenance_date'], name='maintenance_item_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='itemcheckout',
+            index=models.Index(fields=['item', '-checkout_date'], name='checkout_item_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='itemcheckout',
+            index=models.Index(fields=['checked_in_date'], name='checkout_checked_in_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-15 11:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0006_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='itemcheckout',
+            name='checkout_checked_in_idx',
+        ),
+        migrations.AddIndex(
+            model_name='itemcheckout',
+            index=models.Index(fields=['checked_in_date', 'due_date'], name='checkout_open_due_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-15 12:20
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Cast, Round
+
+
+def unit_value_to_cents(apps, schema_editor):
+    Item = apps.get_model('inventory', 'Item')
+    Item.objects.update(
+        unit_value_cents=Cast(Round(F('unit_value') * 100), models.BigIntegerField())
+    )
+
+
+def cents_to_unit_value(apps, schema_editor):
+    Item = apps.get_model('inventory', 'Item')
+    Item.objects.update(
+        unit_value=Cast(F('unit_value_cents'), models.DecimalField(max_digits=12, decimal_places=2)) / 100
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0007_itemcheckout_open_due_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='item',
+            name='unit_value_cents',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='unit value (cents)'),
+        ),
+        migrations.RunPython(unit_value_to_cents, cents_to_unit_value),
+    ]
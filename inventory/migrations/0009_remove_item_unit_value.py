@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-15 12:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0008_item_unit_value_cents'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='item',
+            name='unit_value',
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2 on 2026-10-15 13:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0010_alter_item_image'),
+        ('ministry_areas', '0004_ministryarea_name_trgm'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                """
+                CREATE MATERIALIZED VIEW inventory_summary_mv AS
+                SELECT
+                    ministry_area_id,
+                    COUNT(*) AS item_count,
+                    COALESCE(SUM(quantity * unit_value_cents), 0)::bigint AS total_value_cents,
+                    COUNT(*) FILTER (WHERE quantity <= min_quantity) AS low_stock
+                FROM inventory_item
+                WHERE ministry_area_id IS NOT NULL
+                GROUP BY ministry_area_id
+                """,
+                # REFRESH ... CONCURRENTLY requires a unique index on the view
+                "CREATE UNIQUE INDEX inventory_summary_mv_ministry_area_idx ON inventory_summary_mv (ministry_area_id)",
+            ],
+            reverse_sql="DROP MATERIALIZED VIEW inventory_summary_mv",
+        ),
+        migrations.CreateModel(
+            name='InventorySummary',
+            fields=[
+                ('ministry_area', models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='inventory_summary', serialize=False, to='ministry_areas.ministryarea')),
+                ('item_count', models.PositiveIntegerField()),
+                ('total_value_cents', models.BigIntegerField()),
+                ('low_stock', models.PositiveIntegerField()),
+            ],
+            options={
+                'verbose_name': 'inventory summary',
+                'verbose_name_plural': 'inventory summaries',
+                'db_table': 'inventory_summary_mv',
+                'managed': False,
+            },
+        ),
+    ]
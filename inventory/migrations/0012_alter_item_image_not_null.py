@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-15 18:32
+
+import inventory.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0011_inventorysummary'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='item',
+            name='image',
+            field=models.ImageField(blank=True, upload_to=inventory.models.item_image_path, verbose_name='image'),
+        ),
+    ]
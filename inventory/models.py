@@ -1,10 +1,35 @@
-from django.db import models
+import hashlib
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import connection, models, transaction
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
-from django.core.validators import MinValueValidator
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+
+def cents_to_decimal(cents):
+    """Convert an integer amount of cents to a Decimal currency amount"""
+    return Decimal(cents).scaleb(-2)
+
+
+def decimal_to_cents(value):
+    """Convert a currency amount to an integer amount of cents, rounding half up"""
+    return int((Decimal(str(value)) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def item_image_path(instance, filename):
+    """
+    Build the upload path for an item image.
+    
+    Files are spread across 256 subdirectories keyed by a hash of the filename
+    so no single media directory grows too large.
+    """
+    shard = hashlib.md5(filename.encode(), usedforsecurity=False).hexdigest()[:2]
+    return f"inventory/{shard}/{filename}"
+
 class Category(models.Model):
     """
     Model representing categories for inventory items.
@@ -24,10 +49,36 @@ class Category(models.Model):
     def __str__(self):
         return self.name
     
+    @classmethod
+    def get_tree(cls):
+        """
+        Load the whole category hierarchy with a single recursive query.
+        
+        Returns a list of categories ordered by depth then name; each category has
+        a ``depth`` attribute (0 for top-level categories).
+        """
+        table = connection.ops.quote_name(cls._meta.db_table)
+        return list(cls.objects.raw(f"""
+            WITH RECURSIVE tree AS (
+                SELECT id, parent_id, name, description, 0 AS depth
+                FROM {table}
+                WHERE parent_id IS NULL
+                UNION ALL
+                SELECT c.id, c.parent_id, c.name, c.description, tree.depth + 1
+                FROM {table} c
+                JOIN tree ON c.parent_id = tree.id
+            )
+            SELECT * FROM tree ORDER BY depth, name
+        """))
+    
     class Meta:
         verbose_name = _('category')
         verbose_name_plural = _('categories')
         ordering = ['name']
+        indexes = [
+            # Trigram index on UPPER(name) so the admin's icontains search can use it
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='category_name_trgm'),
+        ]
 
 
 class Item(models.Model):
@@ -44,7 +95,7 @@ class Item(models.Model):
         POOR = 'POOR', _('Poor')
         DAMAGED = 'DAMAGED', _('Damaged')
     
-    name = models.CharField(_('name'), max_length=200)
+    name = models.CharField(_('name'), max_length=200, db_index=True)
     description = models.TextField(_('description'), blank=True)
     category = models.ForeignKey(
         Category,
@@ -61,23 +112,19 @@ class Item(models.Model):
     quantity = models.PositiveIntegerField(_('quantity'), default=0)
     min_quantity = models.PositiveIntegerField(_('minimum quantity'), default=0, 
                                               help_text=_('Minimum quantity before reordering'))
-    unit_value = models.DecimalField(
-        _('unit value'), 
-        max_digits=10, 
-        decimal_places=2, 
-        default=0,
-        validators=[MinValueValidator(0)]
-    )
-    acquisition_date = models.DateField(_('acquisition date'), null=True, blank=True)
+    # Stored as integer cents so value arithmetic stays in native integers
+    unit_value_cents = models.PositiveBigIntegerField(_('unit value (cents)'), default=0)
+    acquisition_date = models.DateField(_('acquisition date'), null=True, blank=True, db_index=True)
     condition = models.CharField(
         _('condition'), 
         max_length=10, 
         choices=Condition.choices,
-        default=Condition.GOOD
+        default=Condition.GOOD,
+        db_index=True
     )
-    location = models.CharField(_('storage location'), max_length=100, blank=True)
+    location = models.CharField(_('storage location'), max_length=100, blank=True, db_index=True)
     barcode = models.CharField(_('barcode'), max_length=100, blank=True, null=True, unique=True)
-    image = models.ImageField(_('image'), upload_to='inventory/', blank=True, null=True)
+    image = models.ImageField(_('image'), upload_to=item_image_path, blank=True)
     notes = models.TextField(_('notes'), blank=True)
     
     created_by = models.ForeignKey(
@@ -98,20 +145,66 @@ class Item(models.Model):
     def __str__(self):
         return self.name
     
+    @property
+    def unit_value(self):
+        """The value per unit as a Decimal currency amount"""
+        return cents_to_decimal(self.unit_value_cents)
+    
+    @unit_value.setter
+    def unit_value(self, value):
+        self.unit_value_cents = decimal_to_cents(value)
+    
+    @property
+    def total_value_cents(self):
+        """Calculate the total value of this item in cents (quantity * unit_value_cents)"""
+        return self.quantity * self.unit_value_cents
+    
     @property
     def total_value(self):
-        """Calculate the total value of this item (quantity * unit_value)"""
-        return self.quantity * self.unit_value
+        """Calculate the total value of this item as a Decimal currency amount"""
+        return cents_to_decimal(self.total_value_cents)
     
     @property
     def needs_reorder(self):
         """Check if the item needs to be reordered based on minimum quantity"""
         return self.quantity <= self.min_quantity
     
+    @classmethod
+    def bulk_create_with_transactions(cls, items, batch_size=None):
+        """
+        Create many items at once along with their initial inventory transactions.
+        
+        bulk_create() does not send post_save, so the initial transaction records
+        normally written by the signal handler are created here in a second batch.
+        """
+        with transaction.atomic():
+            items = cls.objects.bulk_create(items, batch_size=batch_size)
+            InventoryTransaction.objects.bulk_create([
+                InventoryTransaction(
+                    item=item,
+                    transaction_type=InventoryTransaction.TransactionType.ADDITION,
+                    quantity=item.quantity,
+                    previous_quantity=0,
+                    new_quantity=item.quantity,
+                    reason="Initial inventory creation",
+                    conducted_by=item.created_by
+                )
+                for item in items
+            ], batch_size=batch_size)
+            InventorySummary.refresh_on_commit()
+        return items
+    
     class Meta:
         verbose_name = _('inventory item')
         verbose_name_plural = _('inventory items')
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['category', 'ministry_area'], name='item_category_ministry_idx'),
+            models.Index(fields=['ministry_area', 'condition'], name='item_ministry_condition_idx'),
+            # Trigram indexes on UPPER(...) so the admin's icontains search can use them
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='item_name_trgm'),
+            GinIndex(OpClass(Upper('description'), name='gin_trgm_ops'), name='item_description_trgm'),
+        ]
 
 
 class InventoryTransaction(models.Model):
@@ -168,6 +261,11 @@ class InventoryTransaction(models.Model):
         verbose_name = _('inventory transaction')
         verbose_name_plural = _('inventory transactions')
         ordering = ['-transaction_date']
+        indexes = [
+            models.Index(fields=['item', '-transaction_date'], name='txn_item_date_idx'),
+            models.Index(fields=['-transaction_date'], name='txn_date_idx'),
+            models.Index(fields=['transaction_type'], name='txn_type_idx'),
+        ]
 
 
 @receiver(post_save, sender=Item)
@@ -176,7 +274,10 @@ def update_item_quantity(sender, instance, created, **kwargs):
     Signal handler to create a transaction record when an item is first created.
     
     This ensures we have a transaction record for the initial inventory.
+    Fixture loads (raw saves) are skipped since they carry their own records.
     """
+    if kwargs.get('raw'):
+        return
     if created:
         InventoryTransaction.objects.create(
             item=instance,
@@ -189,6 +290,74 @@ def update_item_quantity(sender, instance, created, **kwargs):
         )
 
 
+class InventorySummary(models.Model):
+    """
+    Read-only inventory totals per ministry area.
+    
+    Backed by the inventory_summary_mv materialized view, so dashboards can read
+    precomputed totals instead of aggregating the whole item table. Items without
+    a ministry area are not included.
+    """
+    ministry_area = models.OneToOneField(
+        'ministry_areas.MinistryArea',
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        related_name='inventory_summary'
+    )
+    item_count = models.PositiveIntegerField()
+    total_value_cents = models.BigIntegerField()
+    low_stock = models.PositiveIntegerField()
+    
+    def __str__(self):
+        return f"Inventory summary for {self.ministry_area_id}"
+    
+    @property
+    def total_value(self):
+        """The total value of the ministry's items as a Decimal currency amount"""
+        return cents_to_decimal(self.total_value_cents)
+    
+    @classmethod
+    def refresh(cls):
+        """Recompute the materialized view without blocking readers"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'REFRESH MATERIALIZED VIEW CONCURRENTLY %s' % connection.ops.quote_name(cls._meta.db_table)
+            )
+    
+    @classmethod
+    def refresh_on_commit(cls):
+        """
+        Refresh the view once the current transaction commits.
+        
+        Only one refresh is queued per transaction, however many items it writes.
+        Rolled-back transactions drop their queued callbacks, so this checks the
+        pending callbacks rather than keeping a separate flag. The refresh is
+        robust: by the time it runs the item data is committed, so a failed
+        refresh is logged instead of failing the request.
+        """
+        # run_on_commit holds (savepoint ids, callback, robust) tuples
+        if any(func == cls.refresh for _, func, _ in connection.run_on_commit):
+            return
+        transaction.on_commit(cls.refresh, robust=True)
+    
+    class Meta:
+        managed = False
+        db_table = 'inventory_summary_mv'
+        verbose_name = _('inventory summary')
+        verbose_name_plural = _('inventory summaries')
+
+
+@receiver(post_save, sender=Item)
+@receiver(post_delete, sender=Item)
+def refresh_inventory_summary(sender, instance, **kwargs):
+    """
+    Signal handler to refresh the inventory summary once an item write commits.
+    """
+    if kwargs.get('raw'):
+        return
+    InventorySummary.refresh_on_commit()
+
+
 class Maintenance(models.Model):
     """
     Model for tracking maintenance activities on inventory items.
@@ -219,6 +388,9 @@ class Maintenance(models.Model):
     
     class Meta:
         ordering = ['-maintenance_date']
+        indexes = [
+            models.Index(fields=['item', '-maintenance_date'], name='maintenance_item_date_idx'),
+        ]
 
 
 class ItemCheckout(models.Model):
@@ -260,4 +432,8 @@ class ItemCheckout(models.Model):
         return f"{self.item.name} - checked out by {self.checked_out_by.get_full_name()}"
     
     class Meta:
-        ordering = ['-checkout_date']
\ No newline at end of file
+        ordering = ['-checkout_date']
+        indexes = [
+            models.Index(fields=['item', '-checkout_date'], name='checkout_item_date_idx'),
+            models.Index(fields=['checked_in_date', 'due_date'], name='checkout_open_due_idx'),
+        ]
\ No newline at end of file
@@ -1,3 +1,107 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.contrib import admin
+from django.db import transaction
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.urls import resolve, reverse
+
+from ministry_areas.models import MinistryArea
+from users.models import User
+from .admin import ItemAdmin, ItemAdminForm
+from .models import Category, Item, InventorySummary, cents_to_decimal, decimal_to_cents
+
+
+class MoneyConversionTests(SimpleTestCase):
+    def test_decimal_to_cents_rounds_half_up(self):
+        self.assertEqual(decimal_to_cents(Decimal('12.345')), 1235)
+        self.assertEqual(decimal_to_cents(Decimal('12.344')), 1234)
+        self.assertEqual(decimal_to_cents(Decimal('0.005')), 1)
+
+    def test_decimal_to_cents_accepts_strings_and_floats(self):
+        self.assertEqual(decimal_to_cents('19.99'), 1999)
+        self.assertEqual(decimal_to_cents(19.99), 1999)
+
+    def test_cents_to_decimal(self):
+        self.assertEqual(cents_to_decimal(1235), Decimal('12.35'))
+        self.assertEqual(cents_to_decimal(0), Decimal('0'))
+
+    def test_round_trip(self):
+        for cents in (0, 1, 99, 1235, 10 ** 12):
+            self.assertEqual(decimal_to_cents(cents_to_decimal(cents)), cents)
+
+    def test_item_unit_value(self):
+        item = Item(unit_value=Decimal('12.345'))
+        self.assertEqual(item.unit_value_cents, 1235)
+        self.assertEqual(item.unit_value, Decimal('12.35'))
+
+
+class ItemAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('jane', 'jane@example.com', 'correct-horse-battery')
+        cls.category = Category.objects.create(name='Furniture')
+        cls.ministry_area = MinistryArea.objects.create(name='Worship', slug='worship')
+
+    def test_form_saves_unit_value_as_cents(self):
+        form = ItemAdminForm(data={
+            'name': 'Chair',
+            'category': self.category.pk,
+            'ministry_area': self.ministry_area.pk,
+            'quantity': 3,
+            'min_quantity': 1,
+            'unit_value': '12.35',
+            'condition': Item.Condition.GOOD,
+            'created_by': self.user.pk,
+            'last_updated_by': self.user.pk,
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        item = form.save()
+        item.refresh_from_db()
+        self.assertEqual(item.unit_value_cents, 1235)
+
+    def test_form_shows_unit_value_of_existing_item(self):
+        item = Item(name='Chair', unit_value_cents=1235)
+        self.assertEqual(ItemAdminForm(instance=item).initial['unit_value'], Decimal('12.35'))
+
+    def test_changelist_annotates_total_value(self):
+        item = Item.objects.create(name='Chair', quantity=3, unit_value_cents=1235,
+                                   category=self.category, ministry_area=self.ministry_area)
+        request = RequestFactory().get('/')
+        request.resolver_match = resolve(reverse('admin:inventory_item_changelist'))
+        item_admin = ItemAdmin(Item, admin.site)
+        row = item_admin.get_queryset(request).get(pk=item.pk)
+        self.assertEqual(row._total_value_cents, 3705)
+        self.assertEqual(item_admin.display_total_value(row), '$37.05')
+
+
+class RefreshOnCommitTests(TestCase):
+    # Items are created inside each test, not in setUpTestData, so no refresh is
+    # already pending from the class-wide transaction
+
+    def test_one_refresh_for_many_saves(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                for name in ('Chair', 'Table', 'Lamp'):
+                    Item.objects.create(name=name)
+        self.assertEqual(callbacks, [InventorySummary.refresh])
+
+    def test_one_refresh_for_many_deletes(self):
+        # bulk_create() sends no post_save, so no refresh is queued yet
+        items = Item.objects.bulk_create([Item(name='Chair'), Item(name='Table')])
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                for item in items:
+                    item.delete()
+        self.assertEqual(callbacks, [InventorySummary.refresh])
+
+    def test_rolled_back_savepoint_does_not_suppress_refresh(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        Item.objects.create(name='Chair')
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+                Item.objects.create(name='Table')
+        self.assertEqual(callbacks, [InventorySummary.refresh])
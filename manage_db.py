@@ -14,24 +14,42 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 sys.path.append(str(BASE_DIR))
 
-# Set up Django environment
+# Set up Django environment once so management commands run in-process
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'church_inventory_project.settings')
 
-def run_command(command):
-    """Run a shell command and return the result"""
-    print(f"Running: {command}")
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+import django
+django.setup()
+
+from django.core.management import call_command
+
+def run_command(args, env=None):
+    """Run an external program (argv list) and return whether it succeeded"""
+    print(f"Running: {' '.join(args)}")
+    result = subprocess.run(args, capture_output=True, text=True, env=env)
     if result.returncode != 0:
         print(f"Error: {result.stderr}")
         return False
     print(result.stdout)
     return True
 
+def migrate():
+    """Apply Django migrations in-process"""
+    try:
+        call_command('migrate')
+        return True
+    except Exception as e:
+        print(f"Error running migrations: {e}")
+        return False
+
 def create_superuser():
-    """Create a Django superuser interactively"""
+    """
+    Create a Django superuser.
+    
+    Values are read from the DJANGO_SUPERUSER_* environment variables (the same
+    convention as Django's createsuperuser --noinput); if no email and password
+    are set there, the user is prompted instead.
+    """
     try:
-        import django
-        django.setup()
         from django.contrib.auth import get_user_model
         
         User = get_user_model()
@@ -39,25 +57,66 @@ def create_superuser():
         if User.objects.filter(is_superuser=True).exists():
             print("Superuser already exists. Creating a new one...")
         
-        username = input("Enter username: ")
-        email = input("Enter email: ")
-        first_name = input("Enter first name: ")
-        last_name = input("Enter last name: ")
-        password = input("Enter password: ")
+        fields = ('username', 'email', 'first_name', 'last_name', 'password')
+        values = {field: os.environ.get(f'DJANGO_SUPERUSER_{field.upper()}', '') for field in fields}
+        
+        if not (values['email'] and values['password']):
+            values = {field: input(f"Enter {field.replace('_', ' ')}: ") for field in fields}
         
-        user = User.objects.create_superuser(
-            username=username,
-            email=email,
-            password=password,
-            first_name=first_name,
-            last_name=last_name
-        )
-        print(f"Superuser {username} created successfully!")
+        User.objects.create_superuser(**values)
+        print(f"Superuser {values['username']} created successfully!")
         return True
     except Exception as e:
         print(f"Error creating superuser: {e}")
         return False
 
+def provision_users(path):
+    """
+    Create staff accounts in bulk from a JSON file.
+    
+    The file holds a list of objects with username, email and password keys, plus
+    optional first_name, last_name, role (ADMIN, STAFF or VOLUNTEER; default STAFF),
+    is_staff (default true) and is_superuser.
+    Passwords are hashed in parallel and all users are inserted with one query;
+    accounts that already exist are skipped.
+    """
+    try:
+        import json
+        from concurrent.futures import ThreadPoolExecutor
+        from django.contrib.auth import get_user_model
+        from django.contrib.auth.hashers import make_password
+        
+        User = get_user_model()
+        
+        with open(path) as f:
+            initial_users = json.load(f)
+        
+        with ThreadPoolExecutor() as pool:
+            passwords = list(pool.map(make_password, (u['password'] for u in initial_users)))
+        
+        users = [
+            User(
+                username=u['username'],
+                # bulk_create() skips User.save(), so normalize and fill full_name here
+                email=User.objects.normalize_email(u['email']),
+                password=password,
+                first_name=u.get('first_name', ''),
+                last_name=u.get('last_name', ''),
+                role=User.Role[u.get('role', 'STAFF').upper()],
+                is_staff=u.get('is_staff', True),
+                is_superuser=u.get('is_superuser', False),
+            )
+            for u, password in zip(initial_users, passwords)
+        ]
+        for user in users:
+            user.full_name = user.get_full_name()
+        User.objects.bulk_create(users, ignore_conflicts=True)
+        print(f"Provisioned {len(users)} users from {path}.")
+        return True
+    except Exception as e:
+        print(f"Error provisioning users: {e}")
+        return False
+
 def reset_db():
     """Reset the database by dropping and recreating it"""
     from django.conf import settings
@@ -70,14 +129,14 @@ def reset_db():
     db_host = db_settings['HOST']
     db_port = db_settings['PORT']
     
-    # PostgreSQL commands
-    drop_cmd = f'PGPASSWORD="{db_password}" dropdb -h {db_host} -p {db_port} -U {db_user} {db_name}'
-    create_cmd = f'PGPASSWORD="{db_password}" createdb -h {db_host} -p {db_port} -U {db_user} {db_name}'
+    # PostgreSQL commands; these must run outside of a Django database connection
+    connection_args = ['-h', db_host, '-p', str(db_port), '-U', db_user, db_name]
+    env = {**os.environ, 'PGPASSWORD': db_password}
     
     print(f"Dropping database '{db_name}'...")
-    if run_command(drop_cmd):
+    if run_command(['dropdb', *connection_args], env=env):
         print(f"Creating database '{db_name}'...")
-        if run_command(create_cmd):
+        if run_command(['createdb', *connection_args], env=env):
             print("Database reset successful.")
             return True
     
@@ -98,6 +157,10 @@ def main():
     # Createsuperuser command
     superuser_parser = subparsers.add_parser('createsuperuser', help='Create a Django superuser')
     
+    # Provision command (bulk account creation)
+    provision_parser = subparsers.add_parser('provision', help='Create staff accounts in bulk from a JSON file')
+    provision_parser.add_argument('path', help='JSON file with a list of user objects')
+    
     # Setup command (for initial setup)
     setup_parser = subparsers.add_parser('setup', help='Run complete initial setup')
     
@@ -109,20 +172,20 @@ def main():
     
     # Execute command
     if args.command == 'migrate':
-        run_command('python manage.py migrate')
+        migrate()
     elif args.command == 'reset':
         if reset_db():
-            run_command('python manage.py migrate')
+            migrate()
     elif args.command == 'createsuperuser':
         create_superuser()
+    elif args.command == 'provision':
+        provision_users(args.path)
     elif args.command == 'setup':
-        if run_command('python manage.py migrate'):
+        if migrate():
             create_superuser()
     elif args.command == 'test_connection':
         # Test database connection using Django settings
         try:
-            import django
-            django.setup()
             from django.db import connections
             from django.db.utils import OperationalError
             
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-15 10:02
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # The pg_trgm extension is created by the inventory migration
+        ('inventory', '0006_trigram_search_indexes'),
+        ('ministry_areas', '0003_ministryarea_active_ministryarea_notes_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ministryarea',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='ministry_area_name_trgm'),
+        ),
+    ]
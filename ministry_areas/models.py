@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 class MinistryArea(models.Model):
@@ -24,4 +26,8 @@ class MinistryArea(models.Model):
     class Meta:
         verbose_name = _('ministry area')
         verbose_name_plural = _('ministry areas')
-        ordering = ['name']
\ No newline at end of file
+        ordering = ['name']
+        indexes = [
+            # Trigram index on UPPER(name) so the admin's icontains search can use it
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='ministry_area_name_trgm'),
+        ]
\ No newline at end of file
@@ -2,58 +2,34 @@
 """
 Church Inventory System: Full Database Validation Script
 Checks:
-1. psycopg2 raw connection
-2. Django ORM connection
-3. Model validation
-4. Migration check
-5. Object count in key models
+1. Django ORM connection and PostgreSQL version
+2. Model validation
+3. Migration check
+4. Object count in key models
+
+All checks share the single Django connection rather than opening new ones.
 """
 import os
 import sys
 import django
-import psycopg2
 from django.db import connections
 from django.db.utils import OperationalError
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'church_inventory_project.settings')
 
-def test_psycopg2_connection():
-    """Direct PostgreSQL connection using psycopg2"""
+def test_django_connection():
+    """Test Django ORM database connection and report the PostgreSQL version"""
     try:
+        django.setup()
         from django.conf import settings
         db = settings.DATABASES['default']
-        
         print(f"Connecting to PostgreSQL ({db['NAME']} @ {db['HOST']}:{db['PORT']})...")
         
-        conn = psycopg2.connect(
-            dbname=db['NAME'],
-            user=db['USER'],
-            password=db['PASSWORD'],
-            host=db['HOST'],
-            port=db['PORT']
-        )
-        cur = conn.cursor()
-        cur.execute("SELECT version();")
-        version = cur.fetchone()[0]
-        print(f"✅ psycopg2 connected! PostgreSQL version: {version}")
-        cur.close()
-        conn.close()
+        with connections['default'].cursor() as cursor:
+            cursor.execute("SELECT version()")
+            version = cursor.fetchone()[0]
+        print(f"✅ Django ORM connection successful! PostgreSQL version: {version}")
         return True
-    except Exception as e:
-        print(f"❌ psycopg2 connection failed: {e}")
-        return False
-
-def test_django_connection():
-    """Test Django ORM database connection"""
-    try:
-        django.setup()
-        db_conn = connections['default']
-        with db_conn.cursor() as cursor:
-            cursor.execute("SELECT 1")
-            if cursor.fetchone()[0] == 1:
-                print("✅ Django ORM connection successful!")
-                return True
-        return False
     except OperationalError as e:
         print(f"❌ Django connection error: {e}")
         return False
@@ -80,23 +56,23 @@ def validate_models():
 
 def check_migrations():
     """Check for unapplied migrations"""
-    from django.core.management import call_command
-    from io import StringIO
+    from django.db.migrations.executor import MigrationExecutor
     print("\nChecking migrations...")
-    out = StringIO()
     try:
-        call_command('showmigrations', stdout=out)
-        result = out.getvalue()
-        print("Migration status:\n" + result)
-        if "[ ]" in result:
-            print("⚠️ Some migrations are not applied. Run `python manage.py migrate`.")
+        executor = MigrationExecutor(connections['default'])
+        targets = executor.loader.graph.leaf_nodes()
+        plan = executor.migration_plan(targets)
+        if plan:
+            print(f"⚠️ {len(plan)} migrations are not applied. Run `python manage.py migrate`.")
+            for migration, _ in plan:
+                print(f"  [ ] {migration.app_label}.{migration.name}")
         else:
             print("✅ All migrations are applied.")
     except Exception as e:
         print(f"❌ Migration check failed: {e}")
 
 def count_model_objects():
-    """Count records in core models"""
+    """Count records in core models with a single query"""
     print("\nCounting model objects...")
     try:
         from users.models import User
@@ -111,24 +87,25 @@ def count_model_objects():
             (Maintenance, "Maintenance Records"),
             (ItemCheckout, "Item Checkouts"),
         ]
-        for model, label in models:
-            try:
-                count = model.objects.count()
-                print(f"✅ {label}: {count}")
-            except Exception as e:
-                print(f"❌ {label} error: {e}")
+        conn = connections['default']
+        subqueries = ", ".join(
+            f"(SELECT COUNT(*) FROM {conn.ops.quote_name(model._meta.db_table)})"
+            for model, _ in models
+        )
+        with conn.cursor() as cursor:
+            cursor.execute(f"SELECT {subqueries}")
+            counts = cursor.fetchone()
+        for (_, label), count in zip(models, counts):
+            print(f"✅ {label}: {count}")
     except Exception as e:
-        print(f"❌ Failed to load models: {e}")
+        print(f"❌ Failed to count model objects: {e}")
 
 def main():
     print("\n" + "="*60)
     print("🔍 CHURCH INVENTORY SYSTEM - DATABASE VALIDATION")
     print("="*60)
     
-    psycopg2_ok = test_psycopg2_connection()
-    orm_ok = test_django_connection()
-
-    if psycopg2_ok and orm_ok:
+    if test_django_connection():
         validate_models()
         check_migrations()
         count_model_objects()
@@ -1,8 +1,22 @@
+from functools import lru_cache
+
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import get_language, gettext_lazy as _
+from church_inventory_project.admin_utils import is_changelist
 from .models import User
 
+
+@lru_cache(maxsize=None)
+def _resolved_role_choices(language):
+    return [(value, str(label)) for value, label in User.Role.choices]
+
+
+def role_choices():
+    """Role choices with labels translated once per language instead of on every render"""
+    return _resolved_role_choices(get_language())
+
+
 @admin.register(User)
 class CustomUserAdmin(UserAdmin):
     """
@@ -27,5 +41,18 @@ class CustomUserAdmin(UserAdmin):
     )
     list_display = ('username', 'email', 'first_name', 'last_name', 'role', 'is_staff')
     list_filter = ('role', 'is_staff', 'is_superuser', 'is_active', 'groups', 'ministry_area')
-    search_fields = ('username', 'first_name', 'last_name', 'email', 'phone_number')
-    ordering = ('username',)
\ No newline at end of file
+    search_fields = ('username', 'full_name', 'email', 'phone_number')
+    ordering = ('username',)
+    
+    def formfield_for_choice_field(self, db_field, request, **kwargs):
+        """Use the pre-translated role choices for the role dropdown"""
+        if db_field.name == 'role':
+            kwargs['choices'] = role_choices()
+        return super().formfield_for_choice_field(db_field, request, **kwargs)
+    
+    def get_queryset(self, request):
+        """Get the queryset for the admin view, skipping the bio text on the changelist"""
+        qs = super().get_queryset(request)
+        if is_changelist(request):
+            qs = qs.list_view()
+        return qs
@@ -0,0 +1,26 @@
+from django.contrib.auth.backends import ModelBackend
+from django.core.exceptions import PermissionDenied
+from .models import User
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    Authentication backend that loads the session user from the cache.
+    
+    Authentication itself is unchanged; only the per-request user lookup
+    is served by User.get_cached() instead of a database query.
+    """
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        user = super().authenticate(request, username=username, password=password, **kwargs)
+        if user is None:
+            # ModelBackend is listed after this one only to resolve older sessions;
+            # stop here so a failed login does not run the password hasher twice
+            raise PermissionDenied
+        return user
+    
+    def get_user(self, user_id):
+        try:
+            user = User.get_cached(user_id)
+        except User.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
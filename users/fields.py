@@ -0,0 +1,26 @@
+import unicodedata
+from functools import lru_cache
+
+from django.db import models
+
+
+@lru_cache(maxsize=8192)
+def normalize_email(value):
+    """
+    Normalize an email address for storage and lookup.
+    
+    Applies NFKC normalization, strips surrounding whitespace and case-folds.
+    Results are memoized since the same addresses are normalized on every login.
+    """
+    return unicodedata.normalize('NFKC', value).strip().casefold()
+
+
+class NormalizedEmailField(models.EmailField):
+    """
+    EmailField that stores addresses normalized with normalize_email().
+    """
+    def to_python(self, value):
+        value = super().to_python(value)
+        if isinstance(value, str):
+            return normalize_email(value)
+        return value
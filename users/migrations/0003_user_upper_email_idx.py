@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-15 14:05
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_bio_user_last_updated_user_ministry_area_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='upper_user_email_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2 on 2026-10-15 14:31
+
+import users.models
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower, Trim
+
+
+def lowercase_emails(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    users_by_email = User._base_manager.annotate(normalized=Lower(Trim('email')))
+    duplicates = (
+        users_by_email.values('normalized')
+        .annotate(count=Count('pk'))
+        .filter(count__gt=1)
+        .values_list('normalized', flat=True)
+    )
+    conflicts = users_by_email.filter(normalized__in=duplicates).order_by('normalized', 'pk')
+    if conflicts:
+        raise RuntimeError(
+            'Cannot lowercase user emails; these users differ only by case or '
+            'surrounding spaces: %s. Merge or change them, then migrate again.'
+            % ', '.join('%s (pk=%s)' % (user.email, user.pk) for user in conflicts)
+        )
+    User._base_manager.update(email=Lower(Trim('email')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_upper_email_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', users.models.UserManager()),
+            ],
+        ),
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='upper_user_email_idx',
+        ),
+    ]
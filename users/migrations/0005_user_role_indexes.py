@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-15 14:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_lowercase_user_email'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('ADMIN', 'Admin'), ('STAFF', 'Staff'), ('VOLUNTEER', 'Volunteer')], db_index=True, default='VOLUNTEER', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['ministry_area', 'role'], name='user_ministry_role_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-15 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_user_role_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('role', 'ADMIN')), fields=['id'], name='users_admin_partial_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-15 16:02
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_user_admin_partial_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='phone_number',
+            field=models.CharField(blank=True, default='', max_length=15, validators=[django.core.validators.RegexValidator(re.compile('^\\+?[0-9]{7,15}$'), 'Enter a phone number of 7 to 15 digits, optionally starting with +.')]),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-15 16:44
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Concat, Trim
+
+
+def populate_full_name(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    User.objects.update(full_name=Trim(Concat('first_name', Value(' '), 'last_name')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # The pg_trgm extension is created by the inventory migration
+        ('inventory', '0006_trigram_search_indexes'),
+        ('users', '0007_alter_user_phone_number'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='full_name',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=301, verbose_name='full name'),
+        ),
+        migrations.RunPython(populate_full_name, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='gin_trgm_ops'), name='users_full_name_trgm'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-15 17:08
+
+import django.core.validators
+import django.db.models.deletion
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ministry_areas', '0004_ministryarea_name_trgm'),
+        ('users', '0008_user_full_name'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='ministry_area',
+            field=models.ForeignKey(blank=True, db_column='ma_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='members', to='ministry_areas.ministryarea'),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='phone_number',
+            field=models.CharField(blank=True, db_column='phone', default='', max_length=15, validators=[django.core.validators.RegexValidator(re.compile('^\\+?[0-9]{7,15}$'), 'Enter a phone number of 7 to 15 digits, optionally starting with +.')]),
+        ),
+    ]
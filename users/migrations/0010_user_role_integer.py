@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-15 17:35
+
+from django.db import migrations, models
+
+ROLE_VALUES = {'ADMIN': 1, 'STAFF': 2, 'VOLUNTEER': 3}
+
+
+def role_names_to_integers(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    for name, value in ROLE_VALUES.items():
+        User.objects.filter(role=name).update(role_code=value)
+
+
+def role_integers_to_names(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    for name, value in ROLE_VALUES.items():
+        User.objects.filter(role_code=value).update(role=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0009_short_db_columns'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_ministry_role_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_admin_partial_idx',
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='role_code',
+            field=models.SmallIntegerField(choices=[(1, 'Admin'), (2, 'Staff'), (3, 'Volunteer')], db_index=True, default=3),
+        ),
+        migrations.RunPython(role_names_to_integers, role_integers_to_names),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2 on 2026-10-15 17:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_user_role_integer'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='user',
+            name='role',
+        ),
+        migrations.RenameField(
+            model_name='user',
+            old_name='role_code',
+            new_name='role',
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['ministry_area', 'role'], name='user_ministry_role_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('role', 1)), fields=['id'], name='users_admin_partial_idx'),
+        ),
+    ]
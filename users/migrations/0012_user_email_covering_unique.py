@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-15 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0011_replace_user_role'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='email',
+            field=models.EmailField(max_length=254, verbose_name='email address'),
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(fields=('email',), include=('id', 'role'), name='users_email_covering_uniq'),
+        ),
+    ]
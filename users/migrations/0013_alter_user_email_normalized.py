@@ -0,0 +1,45 @@
+# Generated by Django 5.2 on 2026-10-15 18:58
+
+from collections import defaultdict
+
+import users.fields
+from django.db import migrations
+
+
+def renormalize_non_ascii_emails(apps, schema_editor):
+    # ASCII addresses are already lowercased; only non-ASCII ones can change
+    User = apps.get_model('users', 'User')
+    rows = list(User._base_manager.filter(email__regex=r'[^\x00-\x7f]').values_list('pk', 'email'))
+    normalized = {pk: users.fields.normalize_email(email) for pk, email in rows}
+    # NFKC and casefold() can map two addresses to the same one
+    claimants = defaultdict(list)
+    for pk, email in rows:
+        claimants[normalized[pk]].append((pk, email))
+    existing = User._base_manager.filter(email__in=list(claimants)).exclude(pk__in=normalized)
+    for pk, email in existing.values_list('pk', 'email'):
+        claimants[email].append((pk, email))
+    conflicts = [pair for group in claimants.values() if len(group) > 1 for pair in sorted(group)]
+    if conflicts:
+        raise RuntimeError(
+            'Cannot normalize user emails; these users would end up with the same '
+            'address: %s. Merge or change them, then migrate again.'
+            % ', '.join('%s (pk=%s)' % (email, pk) for pk, email in conflicts)
+        )
+    for pk, email in normalized.items():
+        User._base_manager.filter(pk=pk).update(email=email)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0012_user_email_covering_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='email',
+            field=users.fields.NormalizedEmailField(max_length=254, verbose_name='email address'),
+        ),
+        migrations.RunPython(renormalize_non_ascii_emails, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-15 20:14
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0013_alter_user_email_normalized'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='phone_number',
+            field=models.CharField(blank=True, db_column='phone', default='', max_length=15, validators=[django.core.validators.RegexValidator(re.compile('^\\+?[0-9]{7,14}$'), 'Enter a phone number of 7 to 14 digits, optionally starting with +.')]),
+        ),
+    ]
@@ -1,49 +1,236 @@
+import re
+from functools import cached_property
+
+from django.conf import settings
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as AuthUserManager
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.core.cache import cache
+from django.core.validators import RegexValidator
+from django.db.models.functions import Upper
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from seal.models import SealableModel
+from seal.query import SealableQuerySet
+from .fields import NormalizedEmailField, normalize_email
+
+# Optional leading +, then 7 to 14 digits, so the whole value fits max_length=15
+_PHONE_RE = re.compile(r'^\+?[0-9]{7,14}$')
+
+# How long an authenticated user is kept in the cache, in seconds
+USER_CACHE_TIMEOUT = 60 * 60
+
+
+def user_cache_key(pk):
+    """Build the cache key for a user"""
+    return f"user:{pk}"
+
+
+def user_cache_enabled():
+    """
+    Check whether users may be cached.
+    
+    Invalidation on save only reaches the cache the saving worker uses, so a
+    per-process cache would keep serving stale users in every other worker.
+    """
+    return getattr(settings, 'SHARED_CACHE', False)
+
 
-class User(AbstractUser):
-    class Role(models.TextChoices):
-        ADMIN = 'ADMIN', _('Admin')
-        STAFF = 'STAFF', _('Staff')
-        VOLUNTEER = 'VOLUNTEER', _('Volunteer')
+class UserQuerySet(SealableQuerySet):
+    """
+    QuerySet for User model.
+    
+    Sealed querysets warn (raise under DEBUG) when an attribute that was not
+    loaded up front, such as a related object, is fetched lazily.
+    """
+    def list_view(self):
+        """Skip the unbounded bio text for pages that only list users"""
+        return self.defer('bio').seal()
+
+
+class UserManager(AuthUserManager.from_queryset(UserQuerySet)):
+    """
+    Manager for User model.
+    
+    Emails are stored normalized (NFKC, case-folded), so lookups by email can use
+    plain equality on the unique index instead of case-insensitive matching. The
+    ministry area is joined by default so listing users doesn't fetch it once per row.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related('ministry_area')
+    
+    @classmethod
+    def normalize_email(cls, email):
+        return normalize_email(email or '')
+    
+    def get_by_natural_key(self, username):
+        return super().get_by_natural_key(self.normalize_email(username))
+
+
+class User(SealableModel, AbstractUser):
+    class Role(models.IntegerChoices):
+        ADMIN = 1, _('Admin')
+        STAFF = 2, _('Staff')
+        VOLUNTEER = 3, _('Volunteer')
+    
+    # Plain integer role values for the is_* checks, avoiding enum member lookups
+    _ADMIN = Role.ADMIN.value
+    _STAFF = Role.STAFF.value
+    _VOLUNTEER = Role.VOLUNTEER.value
     
-    email = models.EmailField(_('email address'), unique=True)
-    role = models.CharField(
-        max_length=10,
+    # Unique via the covering constraint in Meta
+    email = NormalizedEmailField(_('email address'), max_length=254)
+    # Kept in sync with first_name/last_name on save for display and search
+    full_name = models.CharField(_('full name'), max_length=301, blank=True, editable=False, db_index=True)
+    role = models.SmallIntegerField(
         choices=Role.choices,
         default=Role.VOLUNTEER,
+        db_index=True,
+    )
+    phone_number = models.CharField(
+        max_length=15,
+        blank=True,
+        default='',
+        db_column='phone',
+        validators=[RegexValidator(_PHONE_RE, _('Enter a phone number of 7 to 14 digits, optionally starting with +.'))],
     )
-    phone_number = models.CharField(max_length=15, blank=True, null=True)
     ministry_area = models.ForeignKey(
         'ministry_areas.MinistryArea',
         on_delete=models.SET_NULL,
         related_name='members',
         null=True,
-        blank=True
+        blank=True,
+        db_column='ma_id'
     )
     bio = models.TextField(blank=True)
     date_joined = models.DateTimeField(auto_now_add=True)
     last_updated = models.DateTimeField(auto_now=True)
     
+    objects = UserManager()
+    
     # Overriding USERNAME_FIELD to use email for authentication
     USERNAME_FIELD = 'email'
     # email is already in REQUIRED_FIELDS by default due to USERNAME_FIELD
     REQUIRED_FIELDS = ['username', 'first_name', 'last_name']
     
     def __str__(self):
-        return f"{self.first_name} {self.last_name} ({self.email})"
+        return self.display_name
+    
+    @cached_property
+    def display_name(self):
+        """Name and email shown wherever the user is rendered, built once per instance"""
+        return "%s (%s)" % (self.full_name or self.get_full_name(), self.email)
+    
+    def save(self, *args, **kwargs):
+        # clean() already normalizes via the manager; this also covers direct saves
+        self.email = self.__class__.objects.normalize_email(self.email)
+        self.full_name = self.get_full_name()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'first_name', 'last_name'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'full_name'}
+        super().save(*args, **kwargs)
+    
+    def touch(self, **fields):
+        """
+        Set the given fields and save only those columns (plus last_updated).
         
-    def is_admin(self):
-        return self.role == self.Role.ADMIN or self.is_superuser
+        Use this for small updates such as a role change or ministry assignment so
+        the UPDATE does not rewrite the whole row.
+        """
+        for name, value in fields.items():
+            setattr(self, name, value)
+        # Drop per-instance cached values that may depend on the changed fields
+        for name in ('is_admin', 'is_staff_member', 'is_volunteer', 'display_name'):
+            self.__dict__.pop(name, None)
+        self.save(update_fields=[*fields, 'last_updated'])
+    
+    @classmethod
+    def get_cached(cls, pk):
+        """
+        Get a user by primary key, serving it from the cache when possible.
         
-    def is_staff_member(self):
-        return self.role == self.Role.STAFF
+        Raises User.DoesNotExist if there is no such user.
+        """
+        if not user_cache_enabled():
+            return cls.objects.get(pk=pk)
+        return cache.get_or_set(
+            user_cache_key(pk),
+            lambda: cls.objects.get(pk=pk),
+            USER_CACHE_TIMEOUT
+        )
+    
+    @classmethod
+    def get_many(cls, ids):
+        """
+        Get several users by primary key in one round trip.
         
+        Cached users are served from the cache; the rest are loaded with a single
+        query and cached. Without a shared cache every user comes from that query.
+        Returns a dict mapping primary key to user; ids that do not exist are left out.
+        """
+        if not user_cache_enabled():
+            return cls.objects.in_bulk(ids)
+        keys = {user_cache_key(pk): pk for pk in ids}
+        cached = cache.get_many(keys)
+        users = {keys[key]: user for key, user in cached.items()}
+        missing = [pk for key, pk in keys.items() if key not in cached]
+        if missing:
+            loaded = cls.objects.in_bulk(missing)
+            cache.set_many({user_cache_key(pk): user for pk, user in loaded.items()}, USER_CACHE_TIMEOUT)
+            users.update(loaded)
+        return users
+    
+    @classmethod
+    def bulk_set_role(cls, user_ids, role):
+        """
+        Assign a role to many users with a single UPDATE.
+        
+        This bypasses save() and its signals, so last_updated is set explicitly and
+        the affected users are dropped from the cache here. Returns the number of
+        users updated.
+        """
+        user_ids = list(user_ids)
+        updated = cls.objects.filter(pk__in=user_ids).update(role=role, last_updated=timezone.now())
+        if user_cache_enabled():
+            cache.delete_many([user_cache_key(pk) for pk in user_ids])
+        return updated
+    
+    # Role checks are cached per instance; request.user is rebuilt every request
+    @cached_property
+    def is_admin(self):
+        return self.role == self._ADMIN or self.is_superuser
+    
+    @cached_property
+    def is_staff_member(self):
+        return self.role == self._STAFF
+    
+    @cached_property
     def is_volunteer(self):
-        return self.role == self.Role.VOLUNTEER
+        return self.role == self._VOLUNTEER
     
     class Meta:
         verbose_name = _('user')
         verbose_name_plural = _('users')
-        
\ No newline at end of file
+        constraints = [
+            # Covering unique index: email lookups that need only id/role skip the heap
+            models.UniqueConstraint(fields=['email'], include=['id', 'role'], name='users_email_covering_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['ministry_area', 'role'], name='user_ministry_role_idx'),
+            # Admins are a small minority, so a partial index keeps admin lookups tiny
+            models.Index(fields=['id'], name='users_admin_partial_idx', condition=models.Q(role=1)),  # Role.ADMIN
+            # Trigram index on UPPER(full_name) so icontains name search can use it
+            GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'), name='users_full_name_trgm'),
+        ]
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    Signal handler to drop a user from the cache whenever it changes.
+    """
+    if user_cache_enabled():
+        cache.delete(user_cache_key(instance.pk))
@@ -1,3 +1,86 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import authenticate
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from .fields import NormalizedEmailField, normalize_email
+from .models import User, user_cache_key
+
+
+class NormalizeEmailTests(SimpleTestCase):
+    def test_strips_and_casefolds(self):
+        self.assertEqual(normalize_email('  Jane.Doe@Example.COM '), 'jane.doe@example.com')
+
+    def test_applies_nfkc(self):
+        # Fullwidth characters fold to their ASCII equivalents
+        self.assertEqual(normalize_email('ＪＡＮＥ@example.com'), 'jane@example.com')
+
+    def test_manager_normalize_email_handles_empty(self):
+        self.assertEqual(User.objects.normalize_email(None), '')
+        self.assertEqual(User.objects.normalize_email('Jane@Example.com'), 'jane@example.com')
+
+
+class NormalizedEmailFieldTests(SimpleTestCase):
+    def test_to_python_normalizes(self):
+        field = NormalizedEmailField()
+        self.assertEqual(field.to_python(' Jane@Example.COM'), 'jane@example.com')
+
+    def test_to_python_keeps_none(self):
+        self.assertIsNone(NormalizedEmailField(null=True).to_python(None))
+
+
+class GetByNaturalKeyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('jane', 'Jane@Example.com', 'correct-horse-battery')
+
+    def test_email_is_stored_normalized(self):
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, 'jane@example.com')
+
+    def test_lookup_ignores_case_and_whitespace(self):
+        self.assertEqual(User.objects.get_by_natural_key(' JANE@example.COM '), self.user)
+
+    def test_lookup_unknown_email(self):
+        with self.assertRaises(User.DoesNotExist):
+            User.objects.get_by_natural_key('nobody@example.com')
+
+
+@override_settings(AUTHENTICATION_BACKENDS=[
+    'users.backends.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+])
+class CachedModelBackendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('jane', 'jane@example.com', 'correct-horse-battery')
+
+    def test_valid_login(self):
+        self.assertEqual(authenticate(username='jane@example.com', password='correct-horse-battery'), self.user)
+
+    def test_failed_login_checks_password_once(self):
+        with mock.patch.object(ModelBackend, 'authenticate', autospec=True, return_value=None) as check:
+            self.assertIsNone(authenticate(username='jane@example.com', password='wrong'))
+        self.assertEqual(check.call_count, 1)
+
+
+class GetManyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('jane', 'jane@example.com', 'correct-horse-battery')
+
+    def tearDown(self):
+        cache.clear()
+
+    @override_settings(SHARED_CACHE=False)
+    def test_skips_cache_without_shared_cache(self):
+        self.assertEqual(User.get_many([self.user.pk, 0]), {self.user.pk: self.user})
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+
+    @override_settings(SHARED_CACHE=True)
+    def test_caches_with_shared_cache(self):
+        User.get_many([self.user.pk])
+        with self.assertNumQueries(0):
+            self.assertEqual(User.get_many([self.user.pk]), {self.user.pk: self.user})